@@ -1,16 +1,17 @@
 """Configuration management with XDG Base Directory support."""
 
-import tomllib
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
-import tomli_w
-from pydantic import BaseModel, Field
+import rtoml
 
 
-class UserConfig(BaseModel):
+@dataclass(slots=True)
+class UserConfig:
     """User configuration model."""
 
-    zip_code: str | None = Field(None, description="User's zip code for weather information")
+    # User's zip code for weather information
+    zip_code: str | None = None
 
 
 class ConfigManager:
@@ -44,10 +45,11 @@ class ConfigManager:
 
         if self._config_file.exists():
             try:
-                with self._config_file.open("rb") as f:
-                    config_data = tomllib.load(f)
-                self._config = UserConfig(**config_data)
-            except (tomllib.TOMLDecodeError, TypeError, ValueError):
+                config_data = rtoml.load(self._config_file)
+                zip_code = config_data.get("zip_code")
+                # A zip code of the wrong type is treated as unset
+                self._config = UserConfig(zip_code=zip_code if isinstance(zip_code, str) else None)
+            except (rtoml.TomlParsingError, TypeError, ValueError):
                 # If config file is corrupted, start with defaults
                 self._config = UserConfig()
         else:
@@ -67,14 +69,18 @@ class ConfigManager:
         self._ensure_config_dir()
 
         # Convert to dict and write TOML
-        config_data = self._config.model_dump(exclude_none=True)
+        config_data = {k: v for k, v in asdict(self._config).items() if v is not None}
 
-        with self._config_file.open("wb") as f:
-            tomli_w.dump(config_data, f)
+        # Write to a temp file and rename so a crash never leaves a torn config
+        tmp_file = self._config_file.with_suffix(".toml.tmp")
+        tmp_file.write_text(rtoml.dumps(config_data))
+        tmp_file.replace(self._config_file)
 
     def update_zip_code(self, zip_code: str) -> None:
         """Update the zip code in configuration."""
         config = self.load_config()
+        if config.zip_code == zip_code:
+            return
         config.zip_code = zip_code
         self._config = config
         self.save_config()
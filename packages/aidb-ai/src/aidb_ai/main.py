@@ -1,34 +1,260 @@
+import asyncio
+import dataclasses
+import functools
 import os
-from typing import Any
+import textwrap
+import time
+from typing import TYPE_CHECKING, Any
 
-import httpx
-from dotenv import load_dotenv
-from pydantic_ai import Agent, RunContext
-from pydantic_ai.models.google import GoogleModel
+import orjson
 
 from .config import ConfigManager
 
-load_dotenv()
+# httpx, pydantic_ai and dotenv are imported lazily to keep CLI startup fast
+if TYPE_CHECKING:
+    import httpx
+
+_HTTP: "httpx.AsyncClient | None" = None
+
+
+@functools.cache
+def _load_env() -> None:
+    """Load variables from a .env file, once per process."""
+    from dotenv import load_dotenv  # noqa: PLC0415
+
+    load_dotenv()
+
+
+def get_http() -> "httpx.AsyncClient":
+    """Get the shared HTTP client, creating it on first use."""
+    global _HTTP  # noqa: PLW0603
+    if _HTTP is None or _HTTP.is_closed:
+        import httpx  # noqa: PLC0415
+
+        _HTTP = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=30),
+        )
+    return _HTTP
+
+
+async def close_http() -> None:
+    """Close the shared HTTP client if it was created."""
+    global _HTTP  # noqa: PLW0603
+    if _HTTP is not None:
+        await _HTTP.aclose()
+        _HTTP = None
+
+
+MAX_HISTORY_MESSAGES = 40
+MAX_RESPONSE_BYTES = 256 * 1024
+HEADLINES_CACHE_TTL = 300
+WEATHER_CACHE_TTL = 600
+
+# Prompts are normalized once at import so no stray whitespace is sent to the model
+_SYSTEM_PROMPT = textwrap.dedent(
+    """
+    You are a helpful AI assistant that provides daily briefings with weather and news.
+    When provided with a zip code, try to give location-specific weather information.
+    Use the get_headlines tool to fetch real news headlines when requested.
+    """
+).strip()
+
+_BRIEFING_TEMPLATE = textwrap.dedent(
+    """
+    Please provide my daily briefing including:
+    1. Current weather information{zip_info}
+    2. Top news headlines with brief summaries
+
+    Keep it concise but informative. Use the data below rather than calling tools.
+
+    Weather data:
+    {weather}
+
+    Headlines data:
+    {headlines}
+    """
+).strip()
+
+
+class _TTLCache:
+    """Minimal in-memory cache whose entries expire after a fixed number of seconds."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: dict[Any, tuple[float, Any]] = {}
+
+    def get(self, key: Any) -> Any | None:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        ts, value = entry
+        if time.monotonic() - ts > self.ttl:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store value under key, resetting its expiry."""
+        self._entries[key] = (time.monotonic(), value)
+
+
+async def _get_json(url: str) -> Any:
+    """GET url and decode its JSON body, refusing bodies over MAX_RESPONSE_BYTES."""
+    async with get_http().stream("GET", url) as response:
+        response.raise_for_status()
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if len(body) > MAX_RESPONSE_BYTES:
+                msg = f"Response from {response.url.host} exceeds {MAX_RESPONSE_BYTES} bytes"
+                raise ValueError(msg)
+    return orjson.loads(body)
 
 
 class AgentDeps:
     """Dependencies for the AI agent."""
 
     def __init__(
-            self,
-            news_api_key: str,
-            weather_api_key: str,
-            zip_code: str | None = None):
+        self,
+        news_api_key: str,
+        weather_api_key: str,
+        zip_code: str | None = None,
+        headlines_cache: _TTLCache | None = None,
+        weather_cache: _TTLCache | None = None,
+    ):
         self.news_api_key = news_api_key
         self.weather_api_key = weather_api_key
         self.zip_code = zip_code
+        self.headlines_cache = headlines_cache
+        self.weather_cache = weather_cache
+
+
+async def _fetch_headlines(deps: AgentDeps, country: str = "us") -> list[dict[str, Any]]:
+    """Fetch top news headlines from NewsAPI."""
+    if not deps.news_api_key:
+        return [
+            {
+                "title": "News API key not configured",
+                "description": "Please set NEWS_API_KEY environment variable",
+            }
+        ]
+
+    cache = deps.headlines_cache
+    if cache is not None and (cached := cache.get(country)) is not None:
+        return cached
+
+    url = (
+        "https://newsapi.org/v2/top-headlines"
+        f"?country={country}&pageSize=5&apiKey={deps.news_api_key}"
+    )
+
+    import httpx  # noqa: PLC0415
+
+    try:
+        data = await _get_json(url)
+        articles = data.get("articles", [])[:5]  # Get top 5 headlines
+
+        # Return simplified structure for the AI
+        headlines = [
+            {
+                "title": a.get("title", ""),
+                "description": a.get("description", ""),
+                "source": (a.get("source") or {}).get("name", ""),
+                "published_at": a.get("publishedAt", ""),
+            }
+            for a in articles
+        ]
+        if cache is not None:
+            cache.set(country, headlines)
+        return headlines
+    except httpx.RequestError as e:
+        return [
+            {
+                "title": f"Error fetching news: {e}",
+                "description": "Could not retrieve news headlines",
+            }
+        ]
+    except Exception as e:
+        return [
+            {
+                "title": f"Unexpected error: {e}",
+                "description": "An error occurred while fetching news",
+            }
+        ]
+
+
+async def _fetch_weather(deps: AgentDeps) -> list[dict[str, Any]]:
+    """Fetch current weather conditions from WeatherAPI."""
+    if not deps.weather_api_key:
+        return [
+            {
+                "title": "Weather API key not configured",
+                "description": "Please set WEATHER_API_KEY environment variable",
+            }
+        ]
+
+    cache = deps.weather_cache
+    if cache is not None and (cached := cache.get(deps.zip_code)) is not None:
+        return cached
+
+    url = (
+        "http://api.weatherapi.com/v1/current.json"
+        f"?key={deps.weather_api_key}&q={deps.zip_code or 'auto:ip'}"
+    )
+
+    import httpx  # noqa: PLC0415
+
+    try:
+        data = await _get_json(url)
+        weather = data.get("current", {})
+        location = data.get("location", {})
+        city = location.get("name", "")
+        region = location.get("region", "")
+        country = location.get("country", "")
+
+        current = [
+            {
+                "title": f"Current Weather for {city}, {region}, {country}",
+                "temp_f": weather.get("temp_f", ""),
+                "humidity": weather.get("humidity", ""),
+                "last_updated": weather.get("last_updated", ""),
+            }
+        ]
+        if cache is not None:
+            cache.set(deps.zip_code, current)
+        return current
+    except httpx.RequestError as e:
+        return [
+            {
+                "title": f"Error fetching weather: {e}",
+                "description": "Could not retrieve current weather",
+            }
+        ]
+    except Exception as e:
+        return [
+            {
+                "title": f"Unexpected error: {e}",
+                "description": "An error occurred while fetching weather",
+            }
+        ]
 
 
 class AIDBAgent:
     def __init__(self):
+        _load_env()
         self.config_manager = ConfigManager()
         self.agent = create_daily_briefing_agent()
         self.message_history = []
+        # Caches live for the lifetime of the agent so repeated turns skip the network
+        self.headlines_cache = _TTLCache(ttl=HEADLINES_CACHE_TTL)
+        self.weather_cache = _TTLCache(ttl=WEATHER_CACHE_TTL)
+        # Environment is read once; deps are built on first use and reused afterwards
+        self._news_api_key = os.getenv("NEWS_API_KEY", "")
+        self._weather_api_key = os.getenv("WEATHER_API_KEY", "")
+        self._deps: AgentDeps | None = None
 
     def request(self, query: str):
         """Query the AI agent for a daily briefing."""
@@ -42,17 +268,54 @@ class AIDBAgent:
             user_prompt=query, message_history=self.message_history, deps=deps
         )
         self.message_history.extend(result.new_messages())
+        self._trim_history()
         return result.output
 
+    def _trim_history(self) -> None:
+        """Keep only the most recent messages, starting at a user turn."""
+        if len(self.message_history) <= MAX_HISTORY_MESSAGES:
+            return
+
+        from pydantic_ai.messages import (  # noqa: PLC0415
+            ModelRequest,
+            SystemPromptPart,
+            UserPromptPart,
+        )
+
+        start = len(self.message_history) - MAX_HISTORY_MESSAGES
+        # Never start mid-turn, or tool returns would lose their matching tool calls
+        while start < len(self.message_history):
+            message = self.message_history[start]
+            if isinstance(message, ModelRequest) and any(
+                isinstance(part, UserPromptPart) for part in message.parts
+            ):
+                break
+            start += 1
+
+        kept = self.message_history[start:]
+        # pydantic-ai only adds the system prompt to an empty history, so carry it forward
+        system_parts = [
+            part
+            for message in self.message_history[:start]
+            if isinstance(message, ModelRequest)
+            for part in message.parts
+            if isinstance(part, SystemPromptPart)
+        ]
+        if kept and system_parts:
+            kept[0] = dataclasses.replace(kept[0], parts=[*system_parts, *kept[0].parts])
+        self.message_history = kept
+
     def _create_deps(self) -> AgentDeps:
-        """Create dependencies for the agent."""
-        news_api_key = os.getenv("NEWS_API_KEY", "")
-        weather_api_key = os.getenv("WEATHER_API_KEY", "")
-        zip_code = self.get_zip_code()
-        return AgentDeps(
-            news_api_key=news_api_key,
-            weather_api_key=weather_api_key,
-            zip_code=zip_code)
+        """Get dependencies for the agent, creating them on first use."""
+        if self._deps is None:
+            self._deps = AgentDeps(
+                news_api_key=self._news_api_key,
+                weather_api_key=self._weather_api_key,
+                zip_code=self.get_zip_code(),
+                headlines_cache=self.headlines_cache,
+                weather_cache=self.weather_cache,
+            )
+        return self._deps
 
     def get_zip_code(self) -> str | None:
         """Get the configured zip code."""
@@ -61,6 +324,8 @@ class AIDBAgent:
     def set_zip_code(self, zip_code: str) -> None:
         """Set the zip code in configuration."""
         self.config_manager.update_zip_code(zip_code)
+        if self._deps is not None:
+            self._deps.zip_code = zip_code
 
     def needs_zip_code(self) -> bool:
         """Check if zip code configuration is needed."""
@@ -68,131 +333,44 @@ class AIDBAgent:
 
     async def get_daily_briefing(self) -> str:
         """Get the daily briefing with weather and news."""
-        zip_code = self.get_zip_code()
-        zip_info = f" for zip code {zip_code}" if zip_code else ""
+        deps = self._create_deps()
+        zip_info = f" for zip code {deps.zip_code}" if deps.zip_code else ""
 
-        briefing_prompt = f"""
-        Please provide my daily briefing including:
-        1. Current weather information{zip_info}
-        2. Top news headlines with brief summaries using the get_headlines tool
+        # Fetch both data sources up front so the model can answer without tool calls
+        headlines, weather = await asyncio.gather(_fetch_headlines(deps), _fetch_weather(deps))
 
-        Keep it concise but informative. Use the tools available to get real data.
-        """
+        briefing_prompt = _BRIEFING_TEMPLATE.format(
+            zip_info=zip_info,
+            weather=orjson.dumps(weather).decode(),
+            headlines=orjson.dumps(headlines).decode(),
+        )
         return await self.request_async(briefing_prompt)
 
+    async def aclose(self) -> None:
+        """Release network resources held by the agent."""
+        await close_http()
+
 
+@functools.cache
 def create_daily_briefing_agent():
-    """Create the daily briefing AI agent."""
+    """Create the daily briefing AI agent.
+
+    The agent is shared process-wide; per-call state travels in AgentDeps.
+    """
+    from pydantic_ai import Agent  # noqa: PLC0415
+    from pydantic_ai.models.google import GoogleModel  # noqa: PLC0415
+
+    from .tools import get_headlines, get_weather  # noqa: PLC0415
+
     model = GoogleModel(model_name="gemini-2.5-flash")
 
     agent = Agent(
         model,
         deps_type=AgentDeps,
-        system_prompt="""
-You are a helpful AI assistant that provides daily briefings with weather and news.
-When provided with a zip code, try to give location-specific weather information.
-Use the get_headlines tool to fetch real news headlines when requested.
-        """,
+        system_prompt=_SYSTEM_PROMPT,
     )
 
-    @agent.tool
-    async def get_headlines(
-        ctx: RunContext[AgentDeps], country: str = "us"
-    ) -> list[dict[str, Any]]:
-        """Fetch top news headlines from NewsAPI."""
-        if not ctx.deps.news_api_key:
-            return [
-                {
-                    "title": "News API key not configured",
-                    "description": "Please set NEWS_API_KEY environment variable",
-                }
-            ]
-
-        url = (
-            f"https://newsapi.org/v2/top-headlines?country={country}&apiKey={ctx.deps.news_api_key}"
-        )
-
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
-                articles = data.get("articles", [])[:5]  # Get top 5 headlines
-
-                # Return simplified structure for the AI
-                return [
-                    {
-                        "title": article.get("title", ""),
-                        "description": article.get("description", ""),
-                        "source": article.get("source", {}).get("name", ""),
-                        "published_at": article.get("publishedAt", ""),
-                    }
-                    for article in articles
-                ]
-            except httpx.RequestError as e:
-                return [
-                    {
-                        "title": f"Error fetching news: {e}",
-                        "description": "Could not retrieve news headlines",
-                    }
-                ]
-            except Exception as e:
-                return [
-                    {
-                        "title": f"Unexpected error: {e}",
-                        "description": "An error occurred while fetching news",
-                    }
-                ]
-
-    @agent.tool
-    async def get_weather(
-        ctx: RunContext[AgentDeps]
-    ) -> list[dict[str, Any]]:
-        """Fetch top news headlines from WeatherAPI."""
-        if not ctx.deps.news_api_key:
-            return [
-                {
-                    "title": "Weather API key not configured",
-                    "description": "Please set WEATHER_API_KEY environment variable",
-                }
-            ]
-
-        url = (
-            f"http://api.weatherapi.com/v1/current.json?key={ctx.deps.weather_api_key}&q={ctx.deps.zip_code or 'auto:ip'}"
-        )
-
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
-                weather = data.get("current", {})
-                location = data.get("location", {})
-                city = location.get("name", ""),
-                region = location.get("region", ""),
-                country =location.get("country", ""),
-
-                return [
-                    {
-                        "title": f"Current Weather for {city}, {region}, {country}",
-                        "temp_f": weather.get("temp_f", ""),
-                        "humidity": weather.get("humidity", ""),
-                        "last_updated": weather.get("last_updated", ""),
-                    }
-                ]
-            except httpx.RequestError as e:
-                return [
-                    {
-                        "title": f"Error fetching weather: {e}",
-                        "description": "Could not retrieve current weather",
-                    }
-                ]
-            except Exception as e:
-                return [
-                    {
-                        "title": f"Unexpected error: {e}",
-                        "description": "An error occurred while fetching weather",
-                    }
-                ]
+    agent.tool(get_headlines)
+    agent.tool(get_weather)
 
     return agent
@@ -0,0 +1,17 @@
+"""Agent tools exposing weather and news data to the model."""
+
+from typing import Any
+
+from pydantic_ai import RunContext
+
+from .main import AgentDeps, _fetch_headlines, _fetch_weather
+
+
+async def get_headlines(ctx: RunContext[AgentDeps], country: str = "us") -> list[dict[str, Any]]:
+    """Fetch top news headlines from NewsAPI."""
+    return await _fetch_headlines(ctx.deps, country)
+
+
+async def get_weather(ctx: RunContext[AgentDeps]) -> list[dict[str, Any]]:
+    """Fetch current weather conditions from WeatherAPI."""
+    return await _fetch_weather(ctx.deps)
@@ -0,0 +1,62 @@
+"""Tests for the AIDB agent wrapper."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    SystemPromptPart,
+    TextPart,
+)
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from aidb_ai import main
+from aidb_ai.main import MAX_HISTORY_MESSAGES, AgentDeps, AIDBAgent
+
+# Enough turns for the history window to slide several times
+TURNS = 25
+
+
+def _has_system_prompt(messages: list[ModelMessage]) -> bool:
+    return any(
+        isinstance(part, SystemPromptPart)
+        for message in messages
+        if isinstance(message, ModelRequest)
+        for part in message.parts
+    )
+
+
+@pytest.fixture
+def agent_and_calls(monkeypatch, tmp_path):
+    """AIDBAgent on a FunctionModel that records whether each call saw the system prompt."""
+    calls: list[bool] = []
+
+    def respond(messages: list[ModelMessage], _info: AgentInfo) -> ModelResponse:
+        calls.append(_has_system_prompt(messages))
+        return ModelResponse(parts=[TextPart("ok")])
+
+    def create_agent() -> Agent:
+        return Agent(FunctionModel(respond), deps_type=AgentDeps, system_prompt=main._SYSTEM_PROMPT)
+
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    monkeypatch.setattr(main, "create_daily_briefing_agent", create_agent)
+    return AIDBAgent(), calls
+
+
+def test_system_prompt_survives_history_trim(agent_and_calls):
+    agent, calls = agent_and_calls
+
+    async def chat() -> None:
+        for turn in range(TURNS):
+            await agent.request_async(f"question {turn}")
+
+    asyncio.run(chat())
+
+    assert len(agent.message_history) <= MAX_HISTORY_MESSAGES
+    assert len(calls) == TURNS
+    assert all(calls)
+    assert _has_system_prompt(agent.message_history[:1])
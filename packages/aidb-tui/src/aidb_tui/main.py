@@ -1,21 +1,34 @@
 """Main CLI application for AI Daily Briefing using Typer and Rich."""
 
 import asyncio
-from datetime import datetime
+import re
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
+from rich.style import Style
 from rich.text import Text
 
 from aidb_ai.main import AIDBAgent
 
+try:
+    import uvloop
+except ImportError:  # Windows, or uvloop not installed
+    uvloop = None
+
 # init rich console
 console = Console()
 
-ZIP_CODE_MIN_LENGTH = 5
-ZIP_CODE_FULL_LENGTH = 10
+# Chat panel styles and titles are built once instead of parsing markup per message
+_USER_STYLE = Style(color="cyan")
+_AI_STYLE = Style(color="green")
+_USER_TITLE = Text("👤 You", style=_USER_STYLE)
+_AI_TITLE = Text("🤖 AI", style=_AI_STYLE)
+
+# ZIP or ZIP+4, e.g. 12345 or 12345-6789
+_ZIP_RE = re.compile(r"\A\d{5}(?:-\d{4})?\Z", re.ASCII)
+_ZIP_CODE_LENGTH = 5
 
 app = typer.Typer(
     name="aidb",
@@ -24,12 +37,19 @@ app = typer.Typer(
 )
 
 
+def is_valid_zip_code(zip_code: str) -> bool:
+    """Check whether zip_code is a US ZIP or ZIP+4 code."""
+    if len(zip_code) == _ZIP_CODE_LENGTH:
+        # Common case: plain 5-digit ZIP, checked in C without the regex engine
+        return zip_code.isascii() and zip_code.isdigit()
+    return _ZIP_RE.match(zip_code) is not None
+
+
 class Session:
     """Manages the interactive chat session."""
 
     def __init__(self):
         self.agent = AIDBAgent()
-        self.session_start = datetime.now()
 
     async def initialize(self) -> None:
         """Initialize session, prompting for configuration if needed."""
@@ -46,15 +66,7 @@ class Session:
 
                 if zip_code and zip_code.strip():
                     zip_code = zip_code.strip()
-                    if len(zip_code) >= ZIP_CODE_MIN_LENGTH and (
-                        zip_code[:ZIP_CODE_MIN_LENGTH].isdigit()
-                        or (
-                            len(zip_code) == ZIP_CODE_FULL_LENGTH
-                            and zip_code[:ZIP_CODE_MIN_LENGTH].isdigit()
-                            and zip_code[ZIP_CODE_MIN_LENGTH] == "-"
-                            and zip_code[ZIP_CODE_MIN_LENGTH + 1 :].isdigit()
-                        )
-                    ):
+                    if is_valid_zip_code(zip_code):
                         self.agent.set_zip_code(zip_code)
                         console.print(
                             f"[green]✅ Zip code {zip_code} saved to configuration[/green]"
@@ -74,6 +86,16 @@ class Session:
         """Get a response from the AI agent."""
         return await self.agent.request_async(message)
 
+    async def close(self) -> None:
+        """Release resources held by the session."""
+        await self.agent.aclose()
+
+
+def run_async(coro):
+    """Run a coroutine to completion, on uvloop when it is available."""
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    return asyncio.run(coro, loop_factory=loop_factory)
+
 
 def display_welcome():
     """Display the welcome message."""
@@ -100,17 +122,11 @@ def display_daily_briefing(briefing: str):
 def display_chat_message(message: str, is_user: bool = True):
     """Display a chat message with appropriate styling."""
     if is_user:
-        prefix = "👤 You"
-        style = "cyan"
-        border_style = "cyan"
+        title, style = _USER_TITLE, _USER_STYLE
     else:
-        prefix = "🤖 AI"
-        style = "green"
-        border_style = "green"
+        title, style = _AI_TITLE, _AI_STYLE
 
-    panel = Panel(
-        message, title=f"[{style}]{prefix}[/{style}]", border_style=border_style, padding=(0, 1)
-    )
+    panel = Panel(message, title=title, border_style=style, padding=(0, 1))
     console.print(panel)
 
 
@@ -158,19 +174,22 @@ def chat(
     session = Session()
 
     async def run_session():
-        await session.initialize()
+        try:
+            await session.initialize()
 
-        if not skip_briefing:
-            console.print("\n[bold yellow]📊 Getting your daily briefing...[/bold yellow]")
+            if not skip_briefing:
+                console.print("\n[bold yellow]📊 Getting your daily briefing...[/bold yellow]")
 
-            with console.status("[bold blue]Fetching weather and news...", spinner="earth"):
-                briefing = await session.get_daily_briefing()
+                with console.status("[bold blue]Fetching weather and news...", spinner="earth"):
+                    briefing = await session.get_daily_briefing()
 
-            display_daily_briefing(briefing)
+                display_daily_briefing(briefing)
 
-        await interactive_chat_loop(session)
+            await interactive_chat_loop(session)
+        finally:
+            await session.close()
 
-    asyncio.run(run_session())
+    run_async(run_session())
 
 
 @app.command()
@@ -182,16 +201,19 @@ def briefing():
     session = Session()
 
     async def get_briefing():
-        await session.initialize()
+        try:
+            await session.initialize()
 
-        console.print("\n[bold yellow]📊 Getting your daily briefing...[/bold yellow]")
+            console.print("\n[bold yellow]📊 Getting your daily briefing...[/bold yellow]")
 
-        with console.status("[bold blue]Fetching weather and news...", spinner="earth"):
-            briefing = await session.get_daily_briefing()
+            with console.status("[bold blue]Fetching weather and news...", spinner="earth"):
+                briefing = await session.get_daily_briefing()
 
-        display_daily_briefing(briefing)
+            display_daily_briefing(briefing)
+        finally:
+            await session.close()
 
-    asyncio.run(get_briefing())
+    run_async(get_briefing())
 
 
 def main():